@@ -0,0 +1,152 @@
+"""
+Module for keeping a pool of pre-warmed Selenium WebDriver instances.
+"""
+
+import queue
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from selenium.common import WebDriverException
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from driver_init import init_driver
+
+
+class BrowserPool:
+    """
+    A pool of Chrome WebDriver instances that are reused across tasks.
+
+    Drivers are started up front and handed out one at a time. A driver is
+    quit after it has been used ``max_uses`` times or once its session fails;
+    its replacement is started by the next ``acquire``.
+
+    The pool is not thread-safe: each worker process keeps its own pool and
+    uses it from a single thread.
+    """
+
+    def __init__(self, size: int = 4, max_uses: int = 50, headless: bool = True):
+        """
+        Initializes the pool and starts its drivers. If one fails to start,
+        the drivers already started are quit before the error is raised.
+
+        Args:
+            size (int): Number of drivers kept alive.
+            max_uses (int): Number of uses after which a driver is recycled.
+            headless (bool): Determines whether to run the browsers in headless mode.
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self._idle: "queue.Queue[WebDriver]" = queue.Queue()
+        self._uses: Dict[int, int] = {}
+        try:
+            for _ in range(size):
+                self._idle.put(self._spawn())
+        except BaseException:
+            self.close()
+            raise
+
+    def _spawn(self) -> WebDriver:
+        """
+        Starts a new driver and registers it in the pool.
+
+        Returns:
+            WebDriver: The started driver.
+        """
+        driver = init_driver(self.headless)
+        self._uses[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver: WebDriver):
+        """
+        Quits a driver and removes it from the pool, freeing its slot.
+
+        Args:
+            driver (WebDriver): The driver to drop.
+        """
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            print(f"Error closing driver: {e}")
+
+    @staticmethod
+    def _is_alive(driver: WebDriver) -> bool:
+        """
+        Checks whether the driver's browser session still responds.
+
+        Args:
+            driver (WebDriver): The driver to check.
+
+        Returns:
+            bool: True if the session answered a trivial command.
+        """
+        try:
+            return driver.execute_script("return true;")
+        except WebDriverException:
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """
+        Takes an idle driver from the pool, starting one if a slot is free,
+        or waiting for one if all drivers are busy.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a driver, forever if None.
+
+        Returns:
+            WebDriver: A driver for exclusive use until it is released.
+
+        Raises:
+            WebDriverException: If a replacement driver could not be started;
+            the slot stays free and the next call tries again.
+        """
+        if self._idle.empty() and len(self._uses) < self.size:
+            return self._spawn()
+        return self._idle.get(timeout=timeout)
+
+    def release(self, driver: WebDriver, failed: bool = False):
+        """
+        Returns a driver to the pool. Drivers that failed, no longer respond or
+        reached ``max_uses`` are quit instead, leaving their slot to ``acquire``.
+
+        Args:
+            driver (WebDriver): The driver previously taken with ``acquire``.
+            failed (bool): Whether the task using the driver hit a WebDriver error.
+        """
+        uses = self._uses.get(id(driver), 0) + 1
+        if failed or uses >= self.max_uses or not self._is_alive(driver):
+            self._discard(driver)
+            return
+        self._uses[id(driver)] = uses
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self) -> Iterator[WebDriver]:
+        """
+        Context manager that acquires a driver and releases it on exit,
+        dropping it if a WebDriver error escaped the block.
+
+        Yields:
+            WebDriver: A driver for exclusive use inside the block.
+        """
+        driver = self.acquire()
+        failed = False
+        try:
+            yield driver
+        except WebDriverException:
+            failed = True
+            raise
+        finally:
+            self.release(driver, failed=failed)
+
+    def close(self):
+        """
+        Quits all idle drivers in the pool.
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
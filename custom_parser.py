@@ -4,148 +4,164 @@ Parser module for web elements using Selenium.
 
 from typing import Optional, Dict
 from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException, TimeoutException, WebDriverException
+)
+
+# Fields read from the info modal in a single ``extract_all`` pass.
+BATCH_FIELDS = (
+    "main_analysis",
+    "lemma",
+    "grammar",
+    "semantics",
+    "related_words",
+    "syntactic_properties",
+    "additional_features",
+)
+
+# Reads every modal field plus the hit context in one WebDriver round-trip.
+# Fields configured with a list of selectors take the first one that matches;
+# ``firstMatch`` checks the candidates without waiting, so a missing field costs nothing.
+EXTRACT_ALL_JS = """
+const [selectors, contextXpath] = arguments;
+const textOf = (el) => (el ? el.innerText.trim() : null);
+const firstMatch = (css) => {
+    for (const candidate of [].concat(css)) {
+        const el = document.querySelector(candidate);
+        if (el) {
+            return textOf(el);
+        }
+    }
+    return null;
+};
+const result = {};
+for (const [key, css] of Object.entries(selectors)) {
+    result[key] = firstMatch(css);
+}
+result.context = textOf(document.evaluate(
+    contextXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue);
+return result;
+"""
+
+# Fetches the JSON behind a hit word's info modal from the page's own origin,
+# so the browser session cookies are sent along, and reads the hit's context
+# from the results page. Resolves to {info, context}, or null on failure.
+FETCH_HIT_INFO_JS = """
+const [element, idAttribute, urlTemplate, contextXpath, done] = arguments;
+const hitId = element.getAttribute(idAttribute);
+if (!hitId) {
+    done(null);
+    return;
+}
+const contextNode = document.evaluate(
+    contextXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+const context = contextNode ? contextNode.innerText.trim() : null;
+fetch(urlTemplate.replace("{id}", encodeURIComponent(hitId)), {credentials: "same-origin"})
+    .then((response) => (response.ok ? response.json() : null))
+    .then((info) => done(info ? {info, context} : null), () => done(null));
+"""
 
 
 class Parser:
     """
     A class used to parse web elements on a page using Selenium.
+
+    All info modal fields are read by ``extract_all`` in a single script call.
     """
 
     def __init__(self, driver: WebDriver, config: Dict):
         """
         Initializes the Parser with a WebDriver and configuration.
 
+        The info modal is awaited for "critical_timeout" seconds (defaults to "timeout");
+        its fields are then read at once, so missing optional fields add no waiting.
+
         Args:
             driver (WebDriver): The WebDriver instance to use.
             config (Dict): A dictionary containing configuration parameters.
         """
         self.driver = driver
         self.config = config
-        self.wait = WebDriverWait(driver, config["timeout"])
-
-    def extract_context(self, position: int) -> Optional[str]:
-        """
-        Extracts the context text of a web element located by a specific position.
-
-        Args:
-            position (int): The position of the web element to extract context from.
-
-        Returns:
-            Optional[str]: The extracted context text or None if extraction fails.
-        """
-        context_xpath = (
-            f"(//span[@class='hit word'])[position()={position}]"
+        # Only the modal itself is awaited explicitly. No implicit wait is set on the driver:
+        # it would also make every find_element(s) lookup of an absent element block, and
+        # Selenium advises against mixing implicit and explicit waits.
+        self.wait = WebDriverWait(driver, config.get("critical_timeout", config["timeout"]))
+
+        css_selectors = config["css_selectors"]
+        self._loc_main = (By.CSS_SELECTOR, css_selectors["main_analysis"])
+        self._batch_selectors = {key: css_selectors[key] for key in BATCH_FIELDS}
+        self._ctx_tmpl = (
+            "(//span[@class='hit word'])[position()=%d]"
             "/ancestor::p[contains(@class, 'seq-with-actions')]"
         )
-        try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.XPATH, context_xpath))).text.strip()
-        except (NoSuchElementException, TimeoutException) as e:
-            print(f"Error extracting context: {e}")
-            return None
+        self._hit_info_url = config.get("hit_info_url")
+        self._hit_id_attr = config.get("hit_id_attribute", "data-id")
+        self._hit_info_fields = config.get("hit_info_fields", {})
 
-    def extract_main_analysis(self) -> Optional[str]:
+    def fetch_hit_info(self, element: WebElement, position: int) -> Optional[Dict[str, Optional[str]]]:
         """
-        Extracts the method of homonymy resolution from the current page.
+        Fetches the info modal fields of a hit word directly from the site's JSON endpoint.
 
-        Returns:
-            Optional[str]: The extracted way of homonymy resolution: automatic or manual.
-        """
-        try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, self.config["css_selectors"]["main_analysis"]))).text.strip()
-            # print(el.is_displayed())
-            # print(el.is_enabled())
-            # print(el.text)
-        except (NoSuchElementException, TimeoutException) as e:
-            print(f"Error extracting main analysis: {e}")
-            return None
+        The endpoint is taken from the optional "hit_info_url" config entry, a URL template
+        with an "{id}" placeholder filled from the hit's "hit_id_attribute" attribute.
+        "hit_info_fields" optionally maps field names to keys of the JSON response.
+        The context is not part of the word's data and is read from the results page.
 
-    def extract_lemma(self) -> Optional[str]:
-        """
-        Extracts the lemma text from the current page.
+        Args:
+            element (WebElement): The hit word element.
+            position (int): The position of the element on the page.
 
         Returns:
-            Optional[str]: The extracted lemma text or None if extraction fails.
+            Optional[Dict[str, Optional[str]]]: The same fields as ``extract_all``,
+            or None if no endpoint is configured or the request fails.
         """
-        try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, self.config["css_selectors"]["lemma"]))).text.strip().lower()
-        except (NoSuchElementException, TimeoutException) as e:
-            print(f"Error extracting lemma: {e}")
+        if not self._hit_info_url:
             return None
-
-    def extract_grammar(self) -> Optional[str]:
-        """
-        Extracts the grammar information from the current page.
-
-        Returns:
-            Optional[str]: The extracted grammar information or None if extraction fails.
-        """
         try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, self.config["css_selectors"]["grammar"]))).text.strip()
-        except (NoSuchElementException, TimeoutException) as e:
-            print(f"Error extracting grammar: {e}")
+            result = self.driver.execute_async_script(
+                FETCH_HIT_INFO_JS, element, self._hit_id_attr, self._hit_info_url,
+                self._ctx_tmpl % position)
+        except (TimeoutException, WebDriverException) as e:
+            print(f"Error fetching hit info: {e}")
+            return None
+        if not isinstance(result, dict) or not isinstance(result.get("info"), dict):
             return None
 
-    def extract_semantics(self) -> Optional[str]:
-        """
-        Extracts semantics from the current page.
+        info = result["info"]
+        data = {}
+        for field in BATCH_FIELDS:
+            value = info.get(self._hit_info_fields.get(field, field))
+            data[field] = value.strip() if isinstance(value, str) else value
+        data["context"] = result.get("context")
+        if isinstance(data.get("lemma"), str):
+            data["lemma"] = data["lemma"].lower()
+        return data
 
-        Returns:
-            Optional[str]: The extracted semantics text or None if extraction fails.
+    def extract_all(self, position: int) -> Optional[Dict[str, Optional[str]]]:
         """
-        try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, self.config["css_selectors"]["semantics"]))).text.strip()
-        except (NoSuchElementException, TimeoutException) as e:
-            print(f"Error extracting semantics: {e}")
-            return None
+        Extracts all info modal fields and the context of a hit word in one script call.
 
-    def extract_related_words(self) -> Optional[str]:
-        """
-        Extracts related words from the current page.
+        Args:
+            position (int): The position of the web element to extract context from.
 
         Returns:
-            Optional[str]: The extracted related words text or None if extraction fails.
+            Optional[Dict[str, Optional[str]]]: The extracted fields keyed by selector name
+            plus "context", or None if the modal did not appear.
         """
         try:
-            return self.wait.until(EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, self.config["css_selectors"]["related_words"]))).text.strip()
+            self.wait.until(EC.visibility_of_element_located(self._loc_main))
         except (NoSuchElementException, TimeoutException) as e:
-            print(f"Error extracting related words: {e}")
+            print(f"Error waiting for info modal: {e}")
             return None
 
-    def extract_syntactic_properties(self) -> Optional[str]:
-        """
-        Iteratively tries to extract syntactic properties using different CSS selectors.
-
-        Returns:
-            Optional[str]: The extracted syntactic properties text or None if all attempts fail.
-        """
-        for css in self.config["css_selectors"]["syntactic_properties"]:
-            try:
-                text_present = EC.presence_of_element_located((By.CSS_SELECTOR, css))
-                return self.wait.until(text_present).text.strip()
-            except (NoSuchElementException, TimeoutException):
-                continue
-        return None
-
-    def extract_additional_features(self) -> Optional[str]:
-        """
-        Iteratively tries to extract additional features using different CSS selectors.
-        Returns:
-            Optional[str]: The additional features words or None if extraction fails.
-        """
-        for css in self.config["css_selectors"]["additional_features"]:
-            try:
-                element_present = EC.presence_of_element_located((By.CSS_SELECTOR, css))
-                return self.wait.until(element_present).text.strip()
-            except (NoSuchElementException, TimeoutException):
-                continue
-        return None
+        data = self.driver.execute_script(
+            EXTRACT_ALL_JS, self._batch_selectors, self._ctx_tmpl % position)
+        if isinstance(data.get("lemma"), str):
+            data["lemma"] = data["lemma"].lower()
+        return data
@@ -2,14 +2,14 @@
 FacadeAPI module to provide a high-level interface for web scraping operations.
 """
 
-from typing import Optional, Any, Tuple, List, Dict
+from typing import Iterator, Optional, Any, Tuple, List, Dict
 from pathlib import Path
 
 from selenium.common import WebDriverException
 
+from browser_pool import BrowserPool
 from scrapper import Scrapper
 from config.config_loader import load_config
-from driver_init import init_driver
 
 CONFIG_PATH = Path(__file__).parent.parent / 'scrapper_config.json'
 
@@ -19,21 +19,28 @@ class FacadeAPI:
     FacadeAPI serves as a high-level interface to interact with the Scrapper class.
     """
 
-    def __init__(self, config_path: Path = CONFIG_PATH):
+    def __init__(self, config_path: Path = CONFIG_PATH, config: Optional[Dict[str, Any]] = None):
         """
-        Initialize the FacadeAPI with configurations and a Scrapper instance.
+        Initialize the FacadeAPI with configurations and a pool of browsers.
 
         Args:
             config_path (str): Path to the configuration JSON file.
+            config (Optional[Dict[str, Any]]): An already loaded configuration;
+                if given, ``config_path`` is not read.
         """
-        self.config = load_config(config_path)
-        self.driver = init_driver(self.config.get("headless", True))
-        self.scrapper = Scrapper(self.driver, self.config)
+        if config is None:
+            config = load_config(config_path)
+        self.config = config
+        self.browser_pool = BrowserPool(
+            size=self.config.get("browser_pool_size", 1),
+            max_uses=self.config.get("browser_max_uses", 50),
+            headless=self.config.get("headless", True)
+        )
 
     def process_word(self, word: str) -> (
             Optional)[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
         """
-        Processes a given word using the Scrapper to collect relevant data.
+        Processes a given word using a Scrapper bound to a pooled browser.
 
         Args:
             word (str): The word to be processed and scraped.
@@ -43,16 +50,37 @@ class FacadeAPI:
             Scraped data associated with the word, or None if an error occurs.
         """
         try:
-            self.scrapper.navigate_to_search()
-            self.scrapper.input_word(word)
-            # self.scrapper.set_page_size()
-            return self.scrapper.collect_data(word)
+            with self.browser_pool.driver() as driver:
+                scrapper = Scrapper(driver, self.config)
+                scrapper.open_search(word)
+                # scrapper.set_page_size()
+                return scrapper.collect_data(word)
         except WebDriverException as e:
             print(f"Error processing word '{word}': {e}")
             return None
 
+    def stream_word(self, word: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streams the scraped data of a given word as it is collected.
+
+        The pooled browser is held until the generator is exhausted or closed.
+
+        Args:
+            word (str): The word to be processed and scraped.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: Aspect category and data of each verb form.
+        """
+        try:
+            with self.browser_pool.driver() as driver:
+                scrapper = Scrapper(driver, self.config)
+                scrapper.open_search(word)
+                yield from scrapper.stream_data(word)
+        except WebDriverException as e:
+            print(f"Error processing word '{word}': {e}")
+
     def close(self):
         """
-        Closes the WebDriver instance to clean up resources.
+        Closes the pooled WebDriver instances to clean up resources.
         """
-        self.scrapper.close_driver()
+        self.browser_pool.close()
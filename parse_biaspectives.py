@@ -1,6 +1,11 @@
+import asyncio
 import json
-from typing import Dict, List
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
+import httpx
+import orjson
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -10,6 +15,28 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selectolax.parser import HTMLParser
+
+
+# Collects [href, text] pairs of all verb links on a category page in one call.
+CATEGORY_LINKS_JS = (
+    "return Array.from(document.querySelectorAll('#mw-pages > div a'))"
+    ".map(a => [a.href.trim(), a.textContent.trim()]);"
+)
+
+
+# Wikimedia asks clients for a descriptive User-Agent with contact information.
+USER_AGENT = (
+    'Biaspectual-Verbs/1.0 '
+    '(https://github.com/yourMasya/Biaspectual-Verbs; morphonology dataset builder) '
+    f'httpx/{httpx.__version__}'
+)
+
+
+@lru_cache(maxsize=None)
+def _driver_path() -> str:
+    """Resolves the ChromeDriver path once per process."""
+    return ChromeDriverManager().install()
 
 
 class Browser:
@@ -20,7 +47,7 @@ class Browser:
         chrome_options = Options()
         chrome_options.add_argument("--headless=new")
         self.driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
+            service=ChromeService(_driver_path()),
             options=chrome_options
         )
 
@@ -36,6 +63,10 @@ class Browser:
         """Finds elements on the page."""
         return self.driver.find_elements(by, selector)
 
+    def execute_script(self, script: str, *args: Any) -> Any:
+        """Executes JavaScript on the current page and returns its result."""
+        return self.driver.execute_script(script, *args)
+
     def quit(self) -> None:
         """Closes the browser."""
         self.driver.quit()
@@ -60,14 +91,9 @@ class PageExtractor:
     def _extract_verbs_from_page(self) -> Dict[str, str]:
         """Extracts verbs and their URLs from the current page."""
         page_dict_articles = {}
-        entries = self.browser.find_elements(By.CSS_SELECTOR, '#mw-pages > div')
-        for entry in entries:
-            verb_elements = entry.find_elements(By.TAG_NAME, 'a')
-            for verb_element in verb_elements:
-                article_url = verb_element.get_attribute('href').strip()
-                verb = verb_element.text.strip()
-                if verb and verb != 'рещи':
-                    page_dict_articles[verb] = article_url
+        for article_url, verb in self.browser.execute_script(CATEGORY_LINKS_JS):
+            if verb and verb != 'рещи':
+                page_dict_articles[verb] = article_url
         return page_dict_articles
 
     def extract_biaspectives(self) -> None:
@@ -98,47 +124,78 @@ class PageExtractor:
         except TimeoutException:
             pass
         finally:
-            self.browser.quit()
             print('Extraction finished')
 
     def save_results(self, filename: str = 'dict_articles_urls.json') -> None:
         """Saves the extracted verb-to-article URL's mapping to a JSON file."""
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(
+        with open(filename, 'wb') as file:
+            file.write(orjson.dumps(
                 self.verb_dict_articles,
-                file,
-                ensure_ascii=False,
-                indent=4
-            )
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
 
 
 class MorphonologyExtractor:
     """Extracts morphemes and stress of biaspectual verbs by pair verb-URL given."""
-    def __init__(self, browser: Browser, path2urls: str) -> None:
+    def __init__(self, path2urls: str, concurrency: int = 10) -> None:
         """
-        Initializes the PageExtractor.
+        Initializes the MorphonologyExtractor.
 
         Args:
-            browser: The browser instance to use for navigation and element finding.
             path2urls: path to .json file with biaspectual verbs and URLs referencing to their Wicktionary page
+            concurrency: maximal number of article pages downloaded at the same time
         """
-        self.browser = browser
         self.path2urls = path2urls
+        self.concurrency = concurrency
         self.morphonology_dataset = []
-        self.wait = WebDriverWait(self.browser.driver, 3)
+        self.failed_verbs: List[str] = []
 
-    def _extract_verb_morphonology(self, verb: str, url: str) -> Dict[str, str]:
-        """Extracts verb morphonology by pair verb-URLs from the current page."""
+    @staticmethod
+    def _parse_verb_morphonology(verb: str, html: str) -> Optional[Dict[str, str]]:
+        """Extracts verb morphonology from the HTML of its Wiktionary article."""
         verb_morphonology = {}
-        self.browser.get(url)
-        verb_features = self.browser.find_elements(By.TAG_NAME, 'p')
-        stress = verb_features[0].text.strip()
-        morphemes = verb_features[2].text.strip()
+        verb_features = HTMLParser(html).css('p')
+        # collapse runs of whitespace and NBSPs the way Selenium's element.text did
+        stress = ' '.join(verb_features[0].text().split())
+        morphemes = ' '.join(verb_features[2].text().split())
         if '[Тихонов, 1996]' in morphemes:
             verb_morphonology['лемма'] = verb if verb else ''
             verb_morphonology['ударение'] = stress if stress else ''
             verb_morphonology['морфемный разбор'] = morphemes if morphemes else ''
             return verb_morphonology
+        return None
+
+    async def _extract_verb_morphonology(
+            self,
+            client: httpx.AsyncClient,
+            semaphore: asyncio.Semaphore,
+            verb: str,
+            url: str
+    ) -> Optional[Dict[str, str]]:
+        """Downloads the article of a verb and extracts its morphonology."""
+        async with semaphore:
+            response = await client.get(url)
+        response.raise_for_status()
+        return self._parse_verb_morphonology(verb, response.text)
+
+    async def _extract_all(
+            self,
+            dict_articles_urls: Dict[str, str]
+    ) -> List[Union[Optional[Dict[str, str]], BaseException]]:
+        """
+        Extracts morphonology of all verbs concurrently, keeping the input order.
+        A verb that failed is represented by its exception.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with httpx.AsyncClient(
+                headers={'User-Agent': USER_AGENT},
+                follow_redirects=True,
+                timeout=15
+        ) as client:
+            return await asyncio.gather(*(
+                self._extract_verb_morphonology(client, semaphore, verb, url)
+                for verb, url in dict_articles_urls.items()
+            ), return_exceptions=True)
 
     def _load_articles_dict(self) -> Dict[str, str]:
         with open(self.path2urls, 'r', encoding='utf-8') as file:
@@ -148,35 +205,47 @@ class MorphonologyExtractor:
     def parse_morphonology_dataset(self) -> None:
         try:
             dict_articles_urls = self._load_articles_dict()
-            for verb, url in dict_articles_urls.items():
-                morphonology_item = self._extract_verb_morphonology(verb, url)
-                if morphonology_item:
-                    self.morphonology_dataset.append(morphonology_item)
-        except IndexError as e:
-            print(e)
+            morphonology_items = asyncio.run(self._extract_all(dict_articles_urls))
+            errors = Counter()
+            for verb, item in zip(dict_articles_urls, morphonology_items):
+                if isinstance(item, httpx.HTTPStatusError):
+                    errors[f'HTTP {item.response.status_code}'] += 1
+                    self.failed_verbs.append(verb)
+                elif isinstance(item, (httpx.HTTPError, IndexError)):
+                    errors[type(item).__name__] += 1
+                    self.failed_verbs.append(verb)
+                elif isinstance(item, BaseException):
+                    raise item
+                elif item:
+                    self.morphonology_dataset.append(item)
+            if self.failed_verbs:
+                summary = ', '.join(f'{error}: {count}' for error, count in errors.most_common())
+                print(f'Failed to extract {len(self.failed_verbs)} of '
+                      f'{len(dict_articles_urls)} verbs ({summary})')
+                print('Failed verbs: ' + ', '.join(self.failed_verbs))
         finally:
-            self.browser.quit()
             print('Dataset created')
         # обработай ошибку, если всё полетит и датасет не создастя
 
     def save_results(self, filename: str) -> None:
         """Saves the extracted morphonology dictionary as a JSON file."""
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(
+        with open(filename, 'wb') as file:
+            file.write(orjson.dumps(
                 self.morphonology_dataset,
-                file,
-                ensure_ascii=False,
-                indent=4
-            )
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
 
 
 if __name__ == "__main__":
     base_url = 'https://ru.wiktionary.org/wiki/%D0%9A%D0%B0%D1%82%D0%B5%D0%B3%D0%BE%D1%80%D0%B8%D1%8F:%D0%94%D0%B2%D1%83%D0%B2%D0%B8%D0%B4%D0%BE%D0%B2%D1%8B%D0%B5_%D0%B3%D0%BB%D0%B0%D0%B3%D0%BE%D0%BB%D1%8B'
     browser = Browser()
-    page_extractor = PageExtractor(browser, base_url)
-    page_extractor.extract_biaspectives()
-    page_extractor.save_results('dict_articles_urls.json')
-    morphonology_extractor = MorphonologyExtractor(browser, 'dict_articles_urls.json')
+    try:
+        page_extractor = PageExtractor(browser, base_url)
+        page_extractor.extract_biaspectives()
+        page_extractor.save_results('dict_articles_urls.json')
+    finally:
+        browser.quit()
+    morphonology_extractor = MorphonologyExtractor('dict_articles_urls.json')
     morphonology_extractor.parse_morphonology_dataset()
     morphonology_extractor.save_results('morphonology_dataset.json')
     with open('biaspectives_relevant_list.txt', 'w', encoding='utf-8') as f:
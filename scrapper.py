@@ -2,16 +2,49 @@
 Module for web scraping using Selenium WebDriver.
 """
 
-import time
-from typing import Tuple, List, Optional, Dict, Any
+import re
+from urllib.parse import quote
+from typing import Iterator, Tuple, List, Optional, Dict, Any
 
-from selenium.common import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.common import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException
+)
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from custom_parser import Parser
 
+SEARCH_INPUT_LOCATOR = (By.CLASS_NAME, "the-input__input")
+HIT_WORD_LOCATOR = (By.CSS_SELECTOR, ".hit.word")
+INFO_MODAL_LOCATOR = (By.CSS_SELECTOR, ".info-modal")
+INFO_MODAL_CLOSE_LOCATOR = (By.CSS_SELECTOR, "button.info-modal__close")
+NEXT_PAGE_LOCATOR = (By.CSS_SELECTOR, ".ant-pagination-next:not(.ant-pagination-disabled)")
+ACTIVE_PAGE_LOCATOR = (By.CSS_SELECTOR, ".ant-pagination-item-active")
+
+# Seconds to wait for the info modal after clicking a hit word.
+MODAL_TIMEOUT = 5
+
+# Scrolls a hit word into view only if it is outside the viewport, then clicks it.
+SCROLL_AND_CLICK_JS = """
+const el = arguments[0];
+const rect = el.getBoundingClientRect();
+const inViewport = rect.top >= 0 && rect.left >= 0
+    && rect.bottom <= (window.innerHeight || document.documentElement.clientHeight)
+    && rect.right <= (window.innerWidth || document.documentElement.clientWidth);
+if (!inViewport) {
+    el.scrollIntoView({block: "center"});
+}
+el.click();
+return true;
+"""
+
+# Reads the part-of-speech attribute of every hit word on the page in one call.
+HIT_POS_JS = (
+    "return Array.from(document.querySelectorAll('.hit.word'))"
+    ".map(el => el.dataset.pos || null);"
+)
+
 
 class Scrapper:
     """
@@ -32,7 +65,35 @@ class Scrapper:
         self.driver = driver
         self.config = config
         self.wait = WebDriverWait(driver, config["timeout"])
+        self.modal_wait = WebDriverWait(driver, MODAL_TIMEOUT)
+        # the pagination re-renders while the page changes, so its nodes may go stale
+        self.page_wait = WebDriverWait(
+            driver, config["timeout"],
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException))
         self.parser = Parser(driver, config)
+        self._loc_search_button = (By.XPATH, config["x_paths"]["search_input"])
+        self._search_url_template = config.get("search_url_template")
+        self._verb_pos_markers = frozenset(
+            marker.lower() for marker in config.get("verb_pos_markers", ()))
+
+    def open_search(self, word: str):
+        """
+        Opens the search results for a word.
+
+        If the configuration has a "search_url_template" with a "{word}" placeholder,
+        the results page is loaded directly; otherwise the search form is filled in.
+
+        Args:
+            word (str): The word to search for.
+        """
+        if not self._search_url_template:
+            self.navigate_to_search()
+            self.input_word(word)
+            return
+        try:
+            self.driver.get(self._search_url_template.format(word=quote(word)))
+        except WebDriverException as e:
+            print(f"Error opening search results: {e}")
 
     def navigate_to_search(self):
         """
@@ -40,8 +101,8 @@ class Scrapper:
         """
         try:
             self.driver.get(self.config["seed_url"])
-            time.sleep(2)  # sleep to ensure the page has loaded
-        except WebDriverException as e:
+            self.wait.until(EC.presence_of_element_located(SEARCH_INPUT_LOCATOR))
+        except (TimeoutException, WebDriverException) as e:
             print(f"Error navigating to search page: {e}")
 
     def input_word(self, word: str):
@@ -53,11 +114,10 @@ class Scrapper:
         """
         try:
             input_element = self.wait.until(
-                EC.visibility_of_element_located((By.CLASS_NAME, "the-input__input")))
+                EC.visibility_of_element_located(SEARCH_INPUT_LOCATOR))
             input_element.clear()
             input_element.send_keys(word)
-            search_button = self.driver.find_element(
-                By.XPATH, self.config["x_paths"]["search_input"])
+            search_button = self.driver.find_element(*self._loc_search_button)
             search_button.click()
         except (NoSuchElementException, TimeoutException, WebDriverException) as e:
             print(f"Error in input_word: {e}")
@@ -94,36 +154,73 @@ class Scrapper:
     #         print(f"Error in input_word: {e}")
 
 
-    def collect_data(self, word: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    @staticmethod
+    def classify_aspect(word_data: Optional[Dict[str, Any]]) -> Optional[str]:
         """
-        Collects data from the search results pages for the given word.
+        Determines the aspect category of a scraped verb form from its grammar field.
 
         Args:
-            word (str): The word for which to collect data.
+            word_data (Optional[Dict[str, Any]]): Data extracted by ``process_element``.
+
+        Returns:
+            Optional[str]: "perf", "imp" or "both", or None if the form is not a verb.
+        """
+        if not word_data or not word_data.get('грамматика') or "глагол" not in word_data['грамматика']:
+            return None
+        grammar = word_data['грамматика']
+        if "несовершенный" in grammar and " совершенный" not in grammar:
+            return "imp"
+        if " совершенный" in grammar and "несовершенный" not in grammar:
+            return "perf"
+        if "несовершенный" in grammar and " совершенный" in grammar:
+            return "both"
+        return None
+
+    def may_be_verb(self, pos: Optional[str]) -> bool:
+        """
+        Checks whether a hit word can be a verb judging by its part-of-speech attribute.
+        The attribute is compared case-insensitively against the "verb_pos_markers"
+        config entry.
+
+        Args:
+            pos (Optional[str]): The hit's "data-pos" attribute, None if it has none.
 
         Returns:
-            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-            Collected perfective and imperfective forms data.
+            bool: False only if the attribute is present and names no verb marker.
+        """
+        if not pos:
+            return True
+        return not self._verb_pos_markers.isdisjoint(re.split(r"[\s,=|]+", pos.lower()))
+
+    def stream_data(self, word: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Lazily collects data from the search results pages for the given word.
+
+        Args:
+            word (str): The word for which to collect data.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: The aspect category ("perf", "imp" or "both")
+            and the data of each verb form as soon as it is scraped.
         """
-        perfective, imperfective, both_possible = [], [], []
         page_number = 1
         while page_number <= 10:
             print(f"Processing page: {page_number}")
             try:
                 hit_word_elements = self.wait.until(
-                    EC.visibility_of_all_elements_located((By.CSS_SELECTOR, ".hit.word")))
-                for i, element in enumerate(hit_word_elements, start=1):
+                    EC.visibility_of_all_elements_located(HIT_WORD_LOCATOR))
+                # hits are only pre-filtered when the site's verb markers are configured
+                if self._verb_pos_markers:
+                    hit_pos = self.driver.execute_script(HIT_POS_JS)
+                else:
+                    hit_pos = [None] * len(hit_word_elements)
+                for i, (element, pos) in enumerate(zip(hit_word_elements, hit_pos), start=1):
+                    if not self.may_be_verb(pos):
+                        continue
                     word_data = self.process_element(element, i)
-                    if word_data and word_data.get('грамматика') and "глагол" in word_data.get('грамматика'):
-                        if ("несовершенный" in word_data['грамматика'] and
-                                " совершенный" not in word_data['грамматика']):
-                            imperfective.append(word_data)
-                        elif (" совершенный" in word_data['грамматика'] and
-                              "несовершенный" not in word_data['грамматика']):
-                            perfective.append(word_data)
-                        elif ("несовершенный" in word_data['грамматика'] and
-                              " совершенный" in word_data['грамматика']):
-                            both_possible.append(word_data)
+                    category = self.classify_aspect(word_data)
+                    if category:
+                        yield category, word_data
 
                 if not self.go_to_next_page():
                     break
@@ -131,12 +228,30 @@ class Scrapper:
             except (NoSuchElementException, TimeoutException, WebDriverException) as e:
                 print(f"Error on page {page_number} for '{word}': {e}")
                 break
-        return perfective, imperfective, both_possible
+
+    def collect_data(self, word: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Collects data from the search results pages for the given word.
+
+        Args:
+            word (str): The word for which to collect data.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+            Collected perfective, imperfective and both-possible forms data.
+        """
+        collected = {"perf": [], "imp": [], "both": []}
+        for category, word_data in self.stream_data(word):
+            collected[category].append(word_data)
+        return collected["perf"], collected["imp"], collected["both"]
 
     def process_element(self, element, position: int) -> Optional[Dict[str, Any]]:
         """
         Processes a web element to extract data like context, lemma, grammar, and syntax features.
 
+        The data is fetched from the site's JSON endpoint when one is configured,
+        falling back to reading the info modal otherwise.
+
         Args:
             element: The web element to process.
             position (int): The position of the element on the page.
@@ -144,44 +259,68 @@ class Scrapper:
         Returns:
             Optional[Dict[str, Any]]: Extracted data from the element or None if an error occurs.
         """
+        print(element.text)
+        data = self.parser.fetch_hit_info(element, position)
+        if data is None:
+            data = self.read_info_modal(element, position)
+        if data is None:
+            return None
+        return {
+            "основной анализ": data["main_analysis"],
+            "словоформа": element.text,
+            "лемма": data["lemma"],
+            "контекст": data["context"],
+            "грамматика": data["grammar"],
+            "семантика": data["semantics"],
+            "похожие слова": data["related_words"],
+            "синтаксические свойства слова": data["syntactic_properties"],
+            "доп. признаки": data["additional_features"]
+        }
 
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(2)
-        self.driver.execute_script("arguments[0].click();", element)
+    def read_info_modal(self, element, position: int) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Opens the info modal of a web element, reads its fields, closes it again
+        and waits until it is gone.
+
+        Args:
+            element: The web element to process.
+            position (int): The position of the element on the page.
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: Fields read by the Parser or None if an error occurs.
+
+        Raises:
+            TimeoutException: If the modal does not close, so that it is never read again
+            as the modal of the next hit.
+        """
+        self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
         try:
-            print(element.text)
-            return {
-                "основной анализ": self.parser.extract_main_analysis(),
-                "словоформа": element.text,
-                "лемма": self.parser.extract_lemma(),
-                "контекст": self.parser.extract_context(position),
-                "грамматика": self.parser.extract_grammar(),
-                "семантика": self.parser.extract_semantics(),
-                "похожие слова": self.parser.extract_related_words(),
-                "синтаксические свойства слова": self.parser.extract_syntactic_properties(),
-                "доп. признаки": self.parser.extract_additional_features()
-            }
+            self.modal_wait.until(EC.visibility_of_element_located(INFO_MODAL_LOCATOR))
+            return self.parser.extract_all(position)
         except (NoSuchElementException, TimeoutException, WebDriverException) as e:
             print(f"Error processing element: {e}")
             return None
         finally:
-            close_button = self.driver.find_element(By.CSS_SELECTOR, "button.info-modal__close")
+            close_button = self.driver.find_element(*INFO_MODAL_CLOSE_LOCATOR)
             self.driver.execute_script("arguments[0].click();", close_button)
-
+            # the next hit's modal waits would otherwise pass on this modal while it closes
+            self.modal_wait.until(EC.invisibility_of_element_located(INFO_MODAL_LOCATOR))
 
     def go_to_next_page(self) -> bool:
         """
-        Attempts to navigate to the next page of search results.
+        Attempts to navigate to the next page of search results and waits until
+        the active page number in the pagination changes.
 
         Returns:
             bool: True if successfully navigated to the next page, False otherwise.
         """
         try:
-            next_page_button = self.driver.find_element(
-                By.CSS_SELECTOR, ".ant-pagination-next:not(.ant-pagination-disabled)")
+            next_page_button = self.driver.find_element(*NEXT_PAGE_LOCATOR)
             if next_page_button.is_enabled():
+                current_page = self.driver.find_element(*ACTIVE_PAGE_LOCATOR).text
                 self.driver.execute_script("arguments[0].click();", next_page_button)
-                time.sleep(2)
+                self.page_wait.until(
+                    lambda driver: driver.find_element(*ACTIVE_PAGE_LOCATOR).text != current_page)
                 return True
             return False
         except (NoSuchElementException, TimeoutException, WebDriverException) as e:
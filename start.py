@@ -4,54 +4,179 @@ Main script to start the web scraping process.
 
 import json
 import os
+from contextlib import ExitStack
+from functools import partial
+from multiprocessing import Pool, cpu_count
+from multiprocessing.util import Finalize
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
+from selenium.common import WebDriverException
+
+from config.config_loader import load_config
 from facade_api import FacadeAPI
 
+MAX_WORKERS = 8
+CATEGORIES = ("perf", "imp", "both")
+REQUIRED_CONFIG_KEYS = ("timeout", "css_selectors", "x_paths")
+
+_config: Optional[Dict[str, Any]] = None
+_scrapper: Optional[FacadeAPI] = None
+
+
+def _load_scrapper_config(config_path: Path) -> Dict[str, Any]:
+    """
+    Loads the scrapper configuration in the main process and checks that the
+    keys every worker needs are present.
+
+    Args:
+        config_path (Path): Path to the scrapper configuration file.
+
+    Returns:
+        Dict[str, Any]: The parsed configuration.
+
+    Raises:
+        KeyError: If a required key is missing.
+    """
+    config = load_config(config_path)
+    missing = [key for key in REQUIRED_CONFIG_KEYS if key not in config]
+    if missing:
+        raise KeyError(f"missing keys in {config_path}: {', '.join(missing)}")
+    return config
+
+
+def _init_worker(config: Dict[str, Any]):
+    """
+    Stores the configuration in a worker process. Nothing that can fail is done
+    here: a failing pool initializer makes the pool respawn workers forever.
+
+    Args:
+        config (Dict[str, Any]): The scrapper configuration loaded by the main process.
+    """
+    global _config
+    _config = config
+
+
+def _get_scrapper() -> FacadeAPI:
+    """
+    Returns the FacadeAPI of the worker process, creating it on first use.
+    Its browsers are reused for every word the worker scrapes and closed
+    when the worker exits.
+
+    Returns:
+        FacadeAPI: The worker's FacadeAPI.
+    """
+    global _scrapper
+    if _scrapper is None:
+        _scrapper = FacadeAPI(config=_config)
+        Finalize(_scrapper, _scrapper.close, exitpriority=10)
+    return _scrapper
+
+
+def _consolidate(jsonl_path: str):
+    """
+    Converts a finished JSON Lines file into a JSON array file next to it,
+    one record at a time, and removes the JSON Lines file.
+
+    Args:
+        jsonl_path (str): Path to the '.jsonl' file to convert.
+    """
+    json_path = os.path.splitext(jsonl_path)[0] + '.json'
+    with open(jsonl_path, 'rb') as src, open(json_path, 'wb') as dst:
+        dst.write(b'[')
+        for i, line in enumerate(src):
+            dst.write(b',\n' if i else b'\n')
+            dst.write(orjson.dumps(orjson.loads(line), option=orjson.OPT_INDENT_2))
+        dst.write(b'\n]')
+    os.remove(jsonl_path)
+
+
+def _scrape_word(word: str, output_dir: str) -> Tuple[str, Optional[Dict[str, int]]]:
+    """
+    Scrapes a single word in a worker process using the worker's browser pool,
+    streaming every record to the word's JSON Lines files as soon as it is scraped.
+    Once the word is finished the files are converted to JSON arrays; on a crash
+    the partial JSON Lines files are left in place.
+
+    Args:
+        word (str): The word to scrape.
+        output_dir (str): Directory to write the word's files into.
+
+    Returns:
+        Tuple[str, Optional[Dict[str, int]]]: The word and the number of records
+        per category, or None instead of the counts if the browser could not start.
+    """
+    print(f"Processing word: {word}")
+    try:
+        scrapper = _get_scrapper()
+    except (WebDriverException, OSError) as e:
+        print(f"Error starting browser for '{word}': {e}")
+        return word, None
+    counts = dict.fromkeys(CATEGORIES, 0)
+    paths = {
+        category: os.path.join(output_dir, f'{word}_{category}.jsonl')
+        for category in CATEGORIES
+    }
+    with ExitStack() as stack:
+        files = {
+            category: stack.enter_context(open(path, 'wb'))
+            for category, path in paths.items()
+        }
+        for category, record in scrapper.stream_word(word):
+            files[category].write(orjson.dumps(record) + b"\n")
+            counts[category] += 1
+    for path in paths.values():
+        _consolidate(path)
+    return word, counts
+
 
 def main():
     """
     Main function to initiate the web scraping process for words listed
     in 'biaspectual_verbs.txt'.
-    Scraped data for each word will be saved in separate JSON files
-    in the 'biaspectual_verbs' directory.
+    Words are scraped in parallel by a pool of worker processes, each keeping
+    its own pool of browsers.
+    Scraped data for each word will be streamed into separate JSON Lines files
+    ('<word>_perf.jsonl', '<word>_imp.jsonl', '<word>_both.jsonl')
+    in the 'biaspectual_verbs' directory and converted to JSON files once the word is done.
     """
-    scrapper = None
     output_dir = 'biaspectual_verbs'
 
     try:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
-        config_path = Path('config/scrapper_config.json')
-        scrapper = FacadeAPI(config_path=config_path)
+        config = _load_scrapper_config(Path('config/scrapper_config.json'))
 
         with open('biaspectives_relevant_list.txt', 'r', encoding='utf-8') as file:
             words = file.read().split()
 
-        for word in words:
-            print(f"Processing word: {word}")
-            perfective_data, imperfective_data, both_posssible = scrapper.process_word(word)
-
-            with open(os.path.join(
-                    output_dir, f'{word}_perf.json'), 'w', encoding='utf-8') as f:
-                json.dump(perfective_data, f, ensure_ascii=False, indent=4)
-
-            with open(os.path.join(
-                    output_dir, f'{word}_imp.json'), 'w', encoding='utf-8') as f:
-                json.dump(imperfective_data, f, ensure_ascii=False, indent=4)
-
-            with open(os.path.join(
-                    output_dir, f'{word}_both.json'), 'w', encoding='utf-8') as f:
-                json.dump(both_posssible, f, ensure_ascii=False, indent=4)
+        processes = min(cpu_count(), MAX_WORKERS)
+        pool = Pool(processes=processes, initializer=_init_worker, initargs=(config,))
+        try:
+            for word, counts in pool.imap_unordered(
+                    partial(_scrape_word, output_dir=output_dir), words):
+                if counts is None:
+                    print(f"Failed word '{word}'")
+                else:
+                    print(f"Finished word '{word}': {counts}")
+        except BaseException:
+            # do not wait for the remaining words on errors or Ctrl-C
+            pool.terminate()
+            raise
+        else:
+            # close() rather than terminate() so workers quit their browsers
+            pool.close()
+        finally:
+            pool.join()
 
     except FileNotFoundError as fnf_error:
         print(f"File not found error: {fnf_error}")
     except json.JSONDecodeError as json_error:
         print(f"JSON decode error: {json_error}")
-    finally:
-        if scrapper:
-            scrapper.close()
+    except KeyError as key_error:
+        print(f"Configuration error: {key_error}")
 
 
 if __name__ == "__main__":